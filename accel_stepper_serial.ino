@@ -56,6 +56,7 @@ void processSerialCommands() {
     
     if (inChar == '\n') {
       stringComplete = true;
+      break;  // One command per pass; pipelined commands stay queued
     } else {
       inputBuffer += inChar;
     }
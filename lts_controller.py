@@ -3,32 +3,70 @@ Thorlabs LTS Linear Stage Controller using Kinesis API
 Supports serial number-based connection
 """
 
+import collections
+import functools
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Errors a device call may raise; a failed call is logged and reported
+# through the return value, anything else is a bug and propagates.
+_DEVICE_ERRORS = (OSError, TimeoutError)
+
+# Both backends are imported on first use: loading pylablib, and above all
+# starting the CLR and loading the Kinesis assemblies, is slow and pointless
+# for processes that never open a stage.
+
 # Option 1: Using pylablib (recommended - easier to use)
-try:
-    from pylablib.devices import Thorlabs
-    PYLABLIB_AVAILABLE = True
-except ImportError:
-    PYLABLIB_AVAILABLE = False
-    print("Warning: pylablib not installed. Install with: pip install pylablib")
+Thorlabs = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pylablib() -> bool:
+    """Import pylablib's Thorlabs module. Returns True if available."""
+    global Thorlabs, _DEVICE_ERRORS
+    try:
+        from pylablib.devices import Thorlabs
+    except ImportError:
+        log.warning("pylablib not installed. Install with: pip install pylablib")
+        return False
+    _DEVICE_ERRORS += (Thorlabs.ThorlabsError,)
+    return True
+
 
 # Option 2: Using Thorlabs Kinesis DLLs directly
-try:
-    import clr
-    import sys
-    # Add path to Kinesis DLLs (adjust path as needed)
-    sys.path.append(r'C:\Program Files\Thorlabs\Kinesis')
-    clr.AddReference("Thorlabs.MotionControl.DeviceManagerCLI")
-    clr.AddReference("Thorlabs.MotionControl.GenericMotorCLI")
-    clr.AddReference("Thorlabs.MotionControl.IntegratedStepperMotorsCLI")
-    
-    from Thorlabs.MotionControl.DeviceManagerCLI import DeviceManagerCLI
-    from Thorlabs.MotionControl.GenericMotorCLI import MotorDirection
-    from Thorlabs.MotionControl.IntegratedStepperMotorsCLI import LongTravelStage
-    
-    KINESIS_DLL_AVAILABLE = True
-except:
-    KINESIS_DLL_AVAILABLE = False
-    print("Warning: Thorlabs Kinesis DLLs not found")
+DeviceManagerCLI = MotorDirection = LongTravelStage = None
+Action = Convert = UInt64 = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_kinesis() -> bool:
+    """Load the Kinesis .NET assemblies. Returns True if available."""
+    global DeviceManagerCLI, MotorDirection, LongTravelStage
+    global Action, Convert, UInt64, _DEVICE_ERRORS
+    try:
+        import clr
+        # Add path to Kinesis DLLs (adjust path as needed)
+        sys.path.append(r'C:\Program Files\Thorlabs\Kinesis')
+        clr.AddReference("Thorlabs.MotionControl.DeviceManagerCLI")
+        clr.AddReference("Thorlabs.MotionControl.GenericMotorCLI")
+        clr.AddReference("Thorlabs.MotionControl.IntegratedStepperMotorsCLI")
+        
+        from Thorlabs.MotionControl.DeviceManagerCLI import DeviceManagerCLI
+        from Thorlabs.MotionControl.GenericMotorCLI import MotorDirection
+        from Thorlabs.MotionControl.IntegratedStepperMotorsCLI import LongTravelStage
+        import System
+        from System import Action, Convert, UInt64
+    except Exception:
+        log.warning("Thorlabs Kinesis DLLs not found")
+        return False
+    _DEVICE_ERRORS += (System.Exception,)
+    return True
 
 
 class ThorlabsLTSController:
@@ -38,21 +76,59 @@ class ThorlabsLTSController:
     Can use either pylablib or native Kinesis DLLs.
     """
     
-    def __init__(self, serial_number: str, use_pylablib: bool = True):
+    # Polling faster than this saturates the USB link on some controllers
+    MIN_POLL_MS = 10
+    
+    # Encoder counts per mm of travel on LTS stages (Kinesis device units)
+    COUNTS_PER_MM = 34304
+    
+    def __init__(self, serial_number: str, use_pylablib: bool = True, poll_ms: int = 50,
+                 on_motion_complete: Optional[Callable[[str], None]] = None,
+                 idle_poll_ms: int = 250):
         """
         Initialize connection to Thorlabs LTS stage.
         
         Args:
             serial_number: Device serial number (e.g., "45123456")
             use_pylablib: If True, use pylablib; if False, use Kinesis DLLs
+            poll_ms: Status polling period in ms while the stage is moving
+                (minimum 10). Shorter periods give fresher position/motion
+                status at the cost of more USB traffic.
+            on_motion_complete: Called with the serial number when a move or
+                home finishes. With the Kinesis DLLs it fires straight from
+                the driver's completion notification (on a driver thread);
+                with pylablib it fires when wait_for_motion_complete() sees
+                the move end.
+            idle_poll_ms: Polling period in ms while the stage is idle.
+                Only the Kinesis DLL backend polls in the background;
+                pylablib uses poll_ms as its wait interval.
         """
         self.serial_number = serial_number
         self.device = None
-        self.use_pylablib = use_pylablib and PYLABLIB_AVAILABLE
+        self.use_pylablib = use_pylablib and _load_pylablib()
+        self.poll_ms = max(int(poll_ms), self.MIN_POLL_MS)
+        self.idle_poll_ms = max(int(idle_poll_ms), self.MIN_POLL_MS)
+        self._polling_ms = None  # Rate the Kinesis device is polling at, None if not polling
+        self._fast_scopes = 0  # Open fast_polling() blocks
+        self._poll_lock = threading.Lock()
+        self._relax_wake = threading.Event()  # Set to have _relax_loop() run
+        # pylablib's KinesisMotor is not thread-safe, and the GUI reads status,
+        # issues moves and stops from different threads; one call at a time
+        self._io_lock = threading.Lock()
+        
+        # Kinesis DLL moves are issued non-blocking; the completion callback
+        # sets this event so waiters never have to poll the device
+        self._motion_done = threading.Event()
+        self._motion_done.set()
+        self._task_callback = None
+        self._task_id = None  # Kinesis task id of the move in flight
+        self._task_lock = threading.Lock()  # Guards _task_id and _sequence
+        self._sequence = collections.deque()  # Remaining targets of move_sequence()
+        self.on_motion_complete = on_motion_complete
         
         if self.use_pylablib:
             self._init_pylablib()
-        elif KINESIS_DLL_AVAILABLE:
+        elif _load_kinesis():
             self._init_kinesis_dll()
         else:
             raise RuntimeError("Neither pylablib nor Kinesis DLLs are available")
@@ -61,7 +137,7 @@ class ThorlabsLTSController:
         """Initialize using pylablib"""
         try:
             self.device = Thorlabs.KinesisMotor(self.serial_number)
-            print(f"Connected to {self.serial_number} via pylablib")
+            log.info("Connected to %s via pylablib", self.serial_number)
         except Exception as e:
             raise ConnectionError(f"Failed to connect to {self.serial_number}: {e}")
     
@@ -80,16 +156,157 @@ class ThorlabsLTSController:
             if not self.device.IsSettingsInitialized():
                 self.device.WaitForSettingsInitialized(5000)
             
-            # Start polling
-            self.device.StartPolling(250)
+            # Start polling at the idle rate; moves switch to the fast rate
+            self.device.StartPolling(self.idle_poll_ms)
+            self._polling_ms = self.idle_poll_ms
             
             # Enable device
             self.device.EnableDevice()
             
-            print(f"Connected to {self.serial_number} via Kinesis DLLs")
+            # Invoked by Kinesis on its own thread when a move/home finishes
+            self._task_callback = Action[UInt64](self._on_task_complete)
+            
+            # Restores the idle polling rate after moves complete
+            threading.Thread(target=self._relax_loop, daemon=True,
+                             name=f"lts-{self.serial_number}-relax").start()
+            
+            log.info("Connected to %s via Kinesis DLLs", self.serial_number)
         except Exception as e:
             raise ConnectionError(f"Failed to connect to {self.serial_number}: {e}")
     
+    def _on_task_complete(self, task_id):
+        """Kinesis completion callback for non-blocking moves."""
+        with self._task_lock:
+            if int(task_id) != self._task_id:
+                # Late report of a move that a newer command or stop() replaced
+                return
+            if self._sequence:
+                # Chain the next move_sequence() target from the driver thread
+                device_units = self._sequence.popleft()
+                try:
+                    self._task_id = int(self.device.MoveTo(device_units, self._task_callback))
+                    return
+                except _DEVICE_ERRORS:
+                    log.error("Sequence move error on %s", self.serial_number, exc_info=True)
+                    self._sequence.clear()
+            self._task_id = None
+            self._motion_done.set()
+        # Restarting polling from the driver's own callback thread is not
+        # safe, so the idle rate is restored by _relax_loop()
+        self._relax_wake.set()
+        self._notify_motion_complete()
+    
+    def _notify_motion_complete(self):
+        """Run the user's on_motion_complete hook, if any."""
+        callback = self.on_motion_complete
+        if callback is not None:
+            try:
+                callback(self.serial_number)
+            except Exception:
+                # Never let a user hook break the driver's callback thread
+                log.exception("on_motion_complete callback failed")
+    
+    def _restart_polling(self, ms: int):
+        """Restart Kinesis background polling at a new period, if it differs.
+        
+        Caller holds _poll_lock. Does nothing once close() has stopped polling.
+        """
+        if not self.use_pylablib and self._polling_ms not in (None, ms):
+            self.device.StopPolling()
+            self.device.StartPolling(ms)
+            self._polling_ms = ms
+    
+    def _relax_polling(self):
+        """Drop back to the idle polling rate once no move is in flight."""
+        # Checked and applied under the lock, so a move starting meanwhile
+        # cannot be left polling at the idle rate
+        with self._poll_lock:
+            if not self._fast_scopes and self._motion_done.is_set():
+                self._restart_polling(self.idle_poll_ms)
+    
+    def _relax_loop(self):
+        """Relax polling each time a move completes, until close()."""
+        while True:
+            self._relax_wake.wait()
+            self._relax_wake.clear()
+            if self._polling_ms is None:
+                return  # closed
+            try:
+                self._relax_polling()
+            except _DEVICE_ERRORS:
+                log.error("Polling change error on %s", self.serial_number, exc_info=True)
+    
+    @contextmanager
+    def fast_polling(self, ms: Optional[int] = None):
+        """
+        Poll the device at a fast rate for the duration of the block.
+        
+        Moves already switch to poll_ms automatically; use this to keep the
+        fast rate across a whole sequence of moves and reads. No-op with
+        pylablib, which does not poll in the background.
+        
+        Args:
+            ms: Polling period in ms (default: poll_ms)
+        """
+        with self._poll_lock:
+            self._fast_scopes += 1
+            self._restart_polling(max(int(ms or self.poll_ms), self.MIN_POLL_MS))
+        try:
+            yield self
+        finally:
+            with self._poll_lock:
+                self._fast_scopes -= 1
+            self._relax_polling()
+    
+    def _start_task(self, issue, sequence=()):
+        """
+        Issue a non-blocking Kinesis command that reports via _task_callback.
+        
+        Args:
+            issue: Called with the callback; returns the Kinesis task id
+            sequence: Device-unit targets to chain after this move
+        """
+        # Held throughout, so a completion callback for an earlier move cannot
+        # mark this one done, nor check the task id before it is recorded
+        with self._task_lock:
+            # Mark the move in flight before raising the rate, so a concurrent
+            # _relax_polling() cannot drop it back to idle
+            self._motion_done.clear()
+            # Fresh status while moving; the rate is relaxed again once the
+            # move completes or is waited for, never from status reads
+            with self._poll_lock:
+                if not self._fast_scopes:
+                    self._restart_polling(self.poll_ms)
+            try:
+                self._sequence.clear()
+                self._sequence.extend(sequence)
+                self._task_id = int(issue(self._task_callback))
+            except Exception:
+                self._task_id = None
+                self._motion_done.set()
+                self._relax_polling()
+                raise
+    
+    def _pylablib_wait(self, busy: Callable[[], bool], timeout: Optional[float]) -> bool:
+        """
+        Poll busy() every poll_ms until it returns False (pylablib backend).
+        
+        The I/O lock is held only for each query, not across the wait, so
+        status reads and stop() from other threads still get through.
+        
+        Returns:
+            False if timeout (seconds, None for no limit) ran out first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        period = self.poll_ms / 1000.0
+        while True:
+            with self._io_lock:
+                if not busy():
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(period)
+    
     def home(self) -> bool:
         """
         Home the stage (move to home position).
@@ -99,13 +316,15 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                self.device.home()
-                self.device.wait_for_home()
+                with self._io_lock:
+                    self.device.home(sync=False)  # waited for below, outside the lock
+                self._pylablib_wait(self.device.is_homing, None)
             else:
-                self.device.Home(60000)  # 60 second timeout
+                self._start_task(self.device.Home)
+                self.wait_for_motion_complete(60.0)
             return True
-        except Exception as e:
-            print(f"Homing error: {e}")
+        except _DEVICE_ERRORS:
+            log.error("Homing error on %s", self.serial_number, exc_info=True)
             return False
     
     def move_absolute(self, position: float) -> bool:
@@ -120,14 +339,14 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                self.device.move_to(position)
+                with self._io_lock:
+                    self.device.move_to(position)
             else:
-                # Convert mm to device units (typically 34304 counts per mm for LTS)
-                device_units = int(position * 34304)
-                self.device.MoveTo(device_units, 60000)
+                device_units = round(position * self.COUNTS_PER_MM)
+                self._start_task(lambda callback: self.device.MoveTo(device_units, callback))
             return True
-        except Exception as e:
-            print(f"Move error: {e}")
+        except _DEVICE_ERRORS:
+            log.error("Move error on %s", self.serial_number, exc_info=True)
             return False
     
     def move_relative(self, distance: float) -> bool:
@@ -142,14 +361,57 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                self.device.move_by(distance)
+                with self._io_lock:
+                    self.device.move_by(distance)
             else:
-                device_units = int(distance * 34304)
-                self.device.MoveRelative(MotorDirection.Forward if distance > 0 else MotorDirection.Backward, 
-                                        abs(device_units), 60000)
+                device_units = round(distance * self.COUNTS_PER_MM)
+                if device_units >= 0:
+                    direction = MotorDirection.Forward
+                else:
+                    direction, device_units = MotorDirection.Backward, -device_units
+                self._start_task(lambda callback: self.device.MoveRelative(direction, device_units, callback))
             return True
-        except Exception as e:
-            print(f"Move error: {e}")
+        except _DEVICE_ERRORS:
+            log.error("Move error on %s", self.serial_number, exc_info=True)
+            return False
+    
+    def move_sequence(self, positions: Iterable[float], timeout: float = 60.0) -> bool:
+        """
+        Move through absolute positions in order and wait for the last one.
+        
+        With the Kinesis DLLs each move is started from the previous move's
+        completion callback, so there is no Python wake-up between moves.
+        
+        Args:
+            positions: Target positions in mm
+            timeout: Maximum time per move in seconds
+            
+        Returns:
+            True if every move completed
+        """
+        positions = list(positions)
+        if not positions:
+            return True
+        try:
+            if self.use_pylablib:
+                for position in positions:
+                    with self._io_lock:
+                        self.device.move_to(position)
+                    if not self._pylablib_wait(self.device.is_moving, timeout):
+                        self.stop()
+                        raise TimeoutError("Motion timeout")
+                self._notify_motion_complete()
+            else:
+                counts_per_mm = self.COUNTS_PER_MM
+                targets = [round(position * counts_per_mm) for position in positions]
+                self._start_task(lambda callback: self.device.MoveTo(targets[0], callback),
+                                 sequence=targets[1:])
+                self.wait_for_motion_complete(timeout * len(targets))
+            return True
+        except _DEVICE_ERRORS:
+            with self._task_lock:
+                self._sequence.clear()
+            log.error("Sequence move error on %s", self.serial_number, exc_info=True)
             return False
     
     def get_position(self) -> float:
@@ -161,12 +423,15 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                return self.device.get_position()
+                with self._io_lock:
+                    return self.device.get_position()
             else:
-                device_units = self.device.Position
-                return device_units / 34304.0  # Convert to mm
-        except Exception as e:
-            print(f"Position read error: {e}")
+                # Position is a .NET Decimal; convert it natively rather than
+                # relying on pythonnet's implicit (or string) conversion
+                device_units = Convert.ToDouble(self.device.Position)
+                return device_units / self.COUNTS_PER_MM  # Convert to mm
+        except _DEVICE_ERRORS:
+            log.error("Position read error on %s", self.serial_number, exc_info=True)
             return 0.0
     
     def stop(self) -> bool:
@@ -178,12 +443,21 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                self.device.stop()
+                with self._io_lock:
+                    self.device.stop()
             else:
+                # Don't let the stopped move's completion start the next one
+                # or count as completion of a later move
+                with self._task_lock:
+                    self._sequence.clear()
+                    self._task_id = None
                 self.device.Stop(60000)
+                # An interrupted move may never report completion
+                self._motion_done.set()
+                self._relax_polling()
             return True
-        except Exception as e:
-            print(f"Stop error: {e}")
+        except _DEVICE_ERRORS:
+            log.error("Stop error on %s", self.serial_number, exc_info=True)
             return False
     
     def is_moving(self) -> bool:
@@ -195,12 +469,34 @@ class ThorlabsLTSController:
         """
         try:
             if self.use_pylablib:
-                return self.device.is_moving()
+                with self._io_lock:
+                    return self.device.is_moving()
             else:
                 return self.device.Status.IsInMotion
-        except:
+        except _DEVICE_ERRORS:
             return False
     
+    def snapshot(self) -> Tuple[bool, float]:
+        """
+        Read motion state and position in one go.
+        
+        On the Kinesis DLL backend both come from a single Status read, so
+        this is cheaper than calling is_moving() and get_position().
+        
+        Returns:
+            Tuple of (is_moving, position_mm)
+        """
+        try:
+            if self.use_pylablib:
+                with self._io_lock:
+                    return self.device.is_moving(), self.device.get_position()
+            else:
+                status = self.device.Status
+                return status.IsInMotion, Convert.ToDouble(status.Position) / self.COUNTS_PER_MM
+        except _DEVICE_ERRORS:
+            log.error("Status read error on %s", self.serial_number, exc_info=True)
+            return False, 0.0
+    
     def wait_for_motion_complete(self, timeout: float = 60.0):
         """
         Wait for motion to complete.
@@ -208,27 +504,35 @@ class ThorlabsLTSController:
         Args:
             timeout: Maximum time to wait in seconds
         """
-        import time
-        start_time = time.time()
-        
-        while self.is_moving():
-            if time.time() - start_time > timeout:
+        if self.use_pylablib:
+            # Poll until the controller reports the move done
+            if not self._pylablib_wait(self.device.is_moving, timeout):
                 self.stop()
                 raise TimeoutError("Motion timeout")
-            time.sleep(0.05)
+            self._notify_motion_complete()
+        else:
+            # Woken by the Kinesis completion callback, no device polling
+            if not self._motion_done.wait(timeout):
+                self.stop()
+                raise TimeoutError("Motion timeout")
+            self._relax_polling()
     
     def close(self):
         """Close connection to device."""
         try:
             if self.device:
                 if self.use_pylablib:
-                    self.device.close()
+                    with self._io_lock:
+                        self.device.close()
                 else:
-                    self.device.StopPolling()
+                    with self._poll_lock:
+                        self.device.StopPolling()
+                        self._polling_ms = None
+                    self._relax_wake.set()  # lets _relax_loop() exit
                     self.device.Disconnect()
-                print(f"Disconnected from {self.serial_number}")
-        except Exception as e:
-            print(f"Close error: {e}")
+                log.info("Disconnected from %s", self.serial_number)
+        except _DEVICE_ERRORS:
+            log.error("Close error on %s", self.serial_number, exc_info=True)
     
     @staticmethod
     def list_devices():
@@ -240,15 +544,15 @@ class ThorlabsLTSController:
         """
         devices = []
         
-        if PYLABLIB_AVAILABLE:
+        if _load_pylablib():
             try:
                 device_list = Thorlabs.list_kinesis_devices()
                 for serial, dev_info in device_list:
                     devices.append((serial, dev_info))
-            except Exception as e:
-                print(f"Error listing devices with pylablib: {e}")
+            except _DEVICE_ERRORS:
+                log.error("Error listing devices with pylablib", exc_info=True)
         
-        elif KINESIS_DLL_AVAILABLE:
+        elif _load_kinesis():
             try:
                 DeviceManagerCLI.BuildDeviceList()
                 device_list = DeviceManagerCLI.GetDeviceList()
@@ -257,8 +561,8 @@ class ThorlabsLTSController:
                     # Get device type
                     device_info = DeviceManagerCLI.GetDeviceInfo(serial)
                     devices.append((serial, device_info.Description))
-            except Exception as e:
-                print(f"Error listing devices with Kinesis DLLs: {e}")
+            except _DEVICE_ERRORS:
+                log.error("Error listing devices with Kinesis DLLs", exc_info=True)
         
         return devices
     
@@ -271,6 +575,8 @@ class ThorlabsLTSController:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # List available devices
     print("Available Kinesis devices:")
     devices = ThorlabsLTSController.list_devices()
@@ -305,10 +611,12 @@ if __name__ == "__main__":
             pos = stage.get_position()
             print(f"Current position: {pos:.3f} mm")
             
-            # Return to zero
-            print("Returning to zero...")
-            stage.move_absolute(0.0)
-            stage.wait_for_motion_complete()
+            # Step through several positions and back to zero in one call
+            print("Scanning 20mm -> 10mm -> 0mm...")
+            stage.move_sequence([20.0, 10.0, 0.0])
+            
+            pos = stage.get_position()
+            print(f"Current position: {pos:.3f} mm")
             
             print("Done!")
     else:
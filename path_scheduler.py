@@ -0,0 +1,58 @@
+"""
+Step scheduling for CSV path execution
+Works out which axes actually change at each step of a path
+"""
+
+import numpy as np
+
+# numba is optional: with it the scan is compiled and runs without the GIL,
+# without it the NumPy version below gives the same result.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Smallest change (mm or RPS) that is worth sending to a controller
+DEFAULT_TOLERANCE = 1e-6
+
+
+def _dirty_axes_loop(path_matrix, tolerance):
+    n_steps, n_axes = path_matrix.shape
+    dirty = np.empty((n_steps, n_axes), dtype=np.bool_)
+    if n_steps == 0:
+        return dirty
+    for j in range(n_axes):
+        dirty[0, j] = True
+    for i in range(1, n_steps):
+        for j in range(n_axes):
+            dirty[i, j] = abs(path_matrix[i, j] - path_matrix[i - 1, j]) > tolerance
+    return dirty
+
+
+def _dirty_axes_numpy(path_matrix, tolerance):
+    dirty = np.empty(path_matrix.shape, dtype=np.bool_)
+    dirty[:1] = True
+    np.greater(np.abs(np.diff(path_matrix, axis=0)), tolerance, out=dirty[1:])
+    return dirty
+
+
+if njit is not None:
+    _dirty_axes = njit(cache=True, nogil=True)(_dirty_axes_loop)
+else:
+    _dirty_axes = _dirty_axes_numpy
+
+
+def dirty_axes(path_matrix: np.ndarray, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Mark the axes each step has to command.
+
+    Args:
+        path_matrix: (n_steps, n_axes) float64 path, one column per axis
+        tolerance: Changes no larger than this count as "unchanged"
+
+    Returns:
+        (n_steps, n_axes) bool array; True where the value differs from the
+        previous step. Every axis is commanded on the first step.
+    """
+    path_matrix = np.ascontiguousarray(path_matrix, dtype=np.float64)
+    return _dirty_axes(path_matrix, float(tolerance))
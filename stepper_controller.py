@@ -1,7 +1,19 @@
+import asyncio
+import logging
+from array import array
+import os
+import re
 import serial
-import serial.tools.list_ports
+import threading
 import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# STATUS:<current_rps>,<target_rps>,<position>, as printed by the firmware
+_STATUS_RE = re.compile(rb"STATUS:(-?\d+(?:\.\d*)?),(-?\d+(?:\.\d*)?),(-?\d+)\r?\n?\Z")
 
 class PicoStepperController:
     """
@@ -10,8 +22,27 @@ class PicoStepperController:
     Protocol:
     - Commands are sent as text strings ending with newline
     - Responses start with OK:, ERROR:, or STATUS:
+    - Setter commands may be pipelined with batch(); responses come back
+      in the same order the commands were sent
+    - The *_async methods run the same calls on a private I/O thread, so
+      asyncio code can overlap Pico round-trips with other work
     """
     
+    # Pre-encoded frames for the fixed commands, so hot paths skip encoding
+    _CMD_BYTES = {
+        "STATUS": b"STATUS\n",
+        "STOP": b"STOP\n",
+        "ENABLE": b"ENABLE\n",
+        "DISABLE": b"DISABLE\n",
+    }
+    
+    # Raspberry Pi USB vendor ID and the RP2040 CDC product IDs
+    # (MicroPython / Arduino-Pico core)
+    PICO_VID = 0x2E8A
+    PICO_PIDS = (0x0005, 0x000A)
+    
+    _detected_port: Optional[str] = None  # Last auto-detected port, reused on reconnect
+    
     def __init__(self, port: Optional[str] = None, baudrate: int = 115200, timeout: float = 1.0):
         """
         Initialize connection to Pico W.
@@ -21,37 +52,146 @@ class PicoStepperController:
             baudrate: Serial baudrate (default 115200)
             timeout: Read timeout in seconds
         """
-        if port is None:
+        auto_detected = port is None
+        if auto_detected:
             port = self._find_pico()
             if port is None:
                 raise ConnectionError("Could not find Pico W. Please specify port manually.")
         
-        self.ser = serial.Serial(port, baudrate, timeout=timeout)
-        time.sleep(2)  # Wait for Arduino to reset
+        self._pending: Optional[List[str]] = None  # Queued commands inside batch()
+        self._io_lock = threading.Lock()  # One command/response exchange at a time
+        self._executor: Optional[ThreadPoolExecutor] = None  # Created on first async call
+        self._rxbuf = bytearray()  # Received bytes not yet returned by _readline()
+        # Short read timeout while waiting for READY, so we react as soon as
+        # the board is up (boards that reset on open just take longer)
+        try:
+            self.ser = serial.Serial(port, baudrate, timeout=0.05)
+        except serial.SerialException:
+            if auto_detected:
+                # Cached port went away; enumerate again next time
+                PicoStepperController._detected_port = None
+            raise
+        self._set_low_latency()
+        
+        # readline() should return on the newline, never wait between bytes
+        self.ser.inter_byte_timeout = None
+        if hasattr(self.ser, 'set_buffer_size'):
+            # Windows only: larger driver buffer so bursts of replies can't back up
+            self.ser.set_buffer_size(rx_size=65536, tx_size=4096)
         
         # Wait for READY signal
-        ready = False
-        start_time = time.time()
-        while time.time() - start_time < 5:
-            if self.ser.in_waiting:
-                line = self.ser.readline().decode('utf-8').strip()
-                if line == "READY":
-                    ready = True
-                    break
+        ready = self._wait_for_ready(5.0)
+        
+        # Drop anything printed around READY so it can't be taken as the
+        # response to the first real command
+        self._reset_input()
+        self.ser.timeout = timeout
         
         if not ready:
-            print("Warning: Did not receive READY signal from Pico")
+            log.warning("Did not receive READY signal from Pico")
         
-        print(f"Connected to Pico W on {port}")
+        log.info("Connected to Pico W on %s", port)
     
     def _find_pico(self) -> Optional[str]:
         """Auto-detect Pico W serial port."""
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            # Pico W typically shows up with these identifiers
-            if "USB Serial" in port.description or "Pico" in port.description:
-                return port.device
-        return None
+        if PicoStepperController._detected_port is not None:
+            return PicoStepperController._detected_port
+        
+        # Only needed for auto-detection, so not imported at module load
+        import serial.tools.list_ports
+        found = None
+        for port in serial.tools.list_ports.comports():
+            if port.vid == self.PICO_VID and port.pid in self.PICO_PIDS:
+                found = port.device
+                break
+            # Pico W typically shows up with these identifiers; used only if
+            # no port matches by VID/PID
+            description = port.description or ""
+            if found is None and ("USB Serial" in description or "Pico" in description):
+                found = port.device
+        
+        PicoStepperController._detected_port = found
+        return found
+    
+    def _set_low_latency(self):
+        """
+        Ask the OS/USB-serial driver to deliver bytes without batching.
+        
+        FTDI-style adapters hold received data for up to 16 ms by default,
+        which dominates every command round-trip. This is best-effort: native
+        USB CDC ports (like the Pico's own) have no latency timer and are
+        left as they are.
+        """
+        # Linux: ASYNC_LOW_LATENCY on the tty
+        if hasattr(self.ser, 'set_low_latency_mode'):
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (OSError, ValueError):
+                pass
+        
+        # Linux FTDI driver: shorten the latency timer to 1 ms
+        tty = os.path.basename(self.ser.port)
+        latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+        if os.path.exists(latency_path):
+            try:
+                with open(latency_path, 'w') as f:
+                    f.write("1")
+            except OSError:
+                pass
+    
+    def _readline(self) -> bytes:
+        """
+        Read one newline-terminated line, honouring the port timeout.
+        
+        pyserial's readline() issues one read per byte. This pulls in
+        everything the driver already holds with each read and keeps the
+        surplus in a reusable buffer for the next call, so pipelined replies
+        cost one read for the whole group. On timeout the partial line is
+        returned, like Serial.readline().
+        """
+        buf = self._rxbuf
+        end = buf.find(b"\n")
+        if end < 0:
+            ser = self.ser
+            deadline = None if ser.timeout is None else time.monotonic() + ser.timeout
+            while True:
+                start = len(buf)
+                buf += ser.read(ser.in_waiting or 1)
+                end = buf.find(b"\n", start)
+                if end >= 0:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    line = bytes(buf)
+                    buf.clear()
+                    return line
+        line = bytes(buf[:end + 1])
+        del buf[:end + 1]
+        return line
+    
+    def _wait_for_ready(self, timeout: float) -> bool:
+        """
+        Wait for the firmware's READY line.
+        
+        Only complete lines are checked; a line split across the short read
+        timeout stays in _rxbuf until the rest of it arrives.
+        """
+        buf = self._rxbuf
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            buf += self.ser.read(self.ser.in_waiting or 1)
+            end = buf.find(b"\n")
+            while end >= 0:
+                line = bytes(buf[:end])
+                del buf[:end + 1]
+                if line.strip() == b"READY":
+                    return True
+                end = buf.find(b"\n")
+        return False
+    
+    def _reset_input(self):
+        """Discard unread input, both in the driver and in _rxbuf."""
+        self.ser.reset_input_buffer()
+        self._rxbuf.clear()
     
     def _send_command(self, command: str) -> str:
         """
@@ -63,9 +203,69 @@ class PicoStepperController:
         Returns:
             Response string from Pico
         """
-        self.ser.write(f"{command}\n".encode('utf-8'))
-        response = self.ser.readline().decode('utf-8').strip()
-        return response
+        frame = self._CMD_BYTES.get(command)
+        if frame is None:
+            frame = f"{command}\n".encode('utf-8')
+        with self._io_lock:
+            self.ser.write(frame)
+            response = self._readline()
+        return response.decode('utf-8').strip()
+    
+    def send_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several commands in a single write, then collect the responses.
+        
+        Costs one USB round-trip instead of one per command.
+        
+        Args:
+            commands: Command strings (without newlines)
+            
+        Returns:
+            Response strings, in the same order as commands
+        """
+        if not commands:
+            return []
+        with self._io_lock:
+            self.ser.write(("\n".join(commands) + "\n").encode('utf-8'))
+            responses = [self._readline() for _ in commands]
+        return [r.decode('utf-8').strip() for r in responses]
+    
+    @contextmanager
+    def batch(self):
+        """
+        Queue setter commands and send them together on exit.
+        
+        Inside the block, setters (enable_motor, set_speed_rps, set_ramp_rate,
+        ...) return True immediately; get_status() and stop() are still sent
+        right away. Example:
+        
+            with controller.batch():
+                controller.enable_motor()
+                controller.set_ramp_rate(500)
+                controller.set_speed_rps(2.0)
+        """
+        if self._pending is not None:
+            # Nested batch: let the outer one flush
+            yield self
+            return
+        
+        self._pending = []
+        try:
+            yield self
+            commands = self._pending
+        finally:
+            self._pending = None
+        
+        for command, response in zip(commands, self.send_batch(commands)):
+            if not response.startswith("OK"):
+                log.warning("'%s' failed: %s", command, response)
+    
+    def _send_setter(self, command: str) -> bool:
+        """Send a setter command, or queue it when inside batch()."""
+        if self._pending is not None:
+            self._pending.append(command)
+            return True
+        return self._send_command(command).startswith("OK")
     
     def set_speed_rps(self, rps: float) -> bool:
         """
@@ -77,8 +277,7 @@ class PicoStepperController:
         Returns:
             True if successful, False otherwise
         """
-        response = self._send_command(f"SPEED_RPS:{rps}")
-        return response.startswith("OK")
+        return self._send_setter(f"SPEED_RPS:{rps}")
     
     def set_speed_steps(self, steps_per_sec: float) -> bool:
         """
@@ -90,8 +289,7 @@ class PicoStepperController:
         Returns:
             True if successful, False otherwise
         """
-        response = self._send_command(f"SPEED_STEPS:{steps_per_sec}")
-        return response.startswith("OK")
+        return self._send_setter(f"SPEED_STEPS:{steps_per_sec}")
     
     def stop(self) -> bool:
         """
@@ -110,8 +308,7 @@ class PicoStepperController:
         Returns:
             True if successful, False otherwise
         """
-        response = self._send_command("ENABLE")
-        return response.startswith("OK")
+        return self._send_setter("ENABLE")
     
     def disable_motor(self) -> bool:
         """
@@ -120,8 +317,7 @@ class PicoStepperController:
         Returns:
             True if successful, False otherwise
         """
-        response = self._send_command("DISABLE")
-        return response.startswith("OK")
+        return self._send_setter("DISABLE")
     
     def set_ramp_rate(self, rate: float) -> bool:
         """
@@ -133,8 +329,7 @@ class PicoStepperController:
         Returns:
             True if successful, False otherwise
         """
-        response = self._send_command(f"RAMP:{rate}")
-        return response.startswith("OK")
+        return self._send_setter(f"RAMP:{rate}")
     
     def get_status(self) -> Optional[Tuple[float, float, int]]:
         """
@@ -143,18 +338,82 @@ class PicoStepperController:
         Returns:
             Tuple of (current_rps, target_rps, position) or None if error
         """
-        response = self._send_command("STATUS")
-        if response.startswith("STATUS:"):
-            try:
-                data = response.split(":")[1]
-                current, target, pos = data.split(",")
-                return (float(current), float(target), int(pos))
-            except:
-                return None
-        return None
+        with self._io_lock:
+            # Drop any late reply to an earlier timed-out command so it
+            # can't be parsed as this status
+            self._reset_input()
+            self.ser.write(self._CMD_BYTES["STATUS"])
+            response = self._readline()
+        m = _STATUS_RE.match(response)
+        if m is None:
+            # Timed out, partial line, or not a STATUS reply
+            return None
+        # float()/int() accept ASCII bytes directly, no decode needed
+        return (float(m[1]), float(m[2]), int(m[3]))
+    
+    def poll_status_block(self, n: int, depth: int = 16) -> Tuple[array, array, array]:
+        """
+        Take n STATUS samples back-to-back for high-rate logging.
+        
+        STATUS requests are pipelined up to depth at a time, so the loop
+        is bound by the link rather than one round-trip per sample.
+        Samples are stored in typed arrays instead of a list of tuples.
+        Replies that fail to parse are dropped, so the arrays may hold
+        fewer than n samples.
+        
+        Args:
+            n: Number of samples to take
+            depth: Maximum STATUS requests in flight (keep the Pico's
+                receive buffer from overflowing)
+            
+        Returns:
+            Tuple of arrays (current_rps, target_rps, position)
+        """
+        current, target, position = array('d'), array('d'), array('q')
+        match, readline = _STATUS_RE.match, self._readline
+        with self._io_lock:
+            self._reset_input()
+            remaining = n
+            while remaining > 0:
+                chunk = min(depth, remaining)
+                self.ser.write(self._CMD_BYTES["STATUS"] * chunk)
+                for _ in range(chunk):
+                    m = match(readline())
+                    if m is not None:
+                        current.append(float(m[1]))
+                        target.append(float(m[2]))
+                        position.append(int(m[3]))
+                remaining -= chunk
+        return current, target, position
+    
+    async def _run_async(self, func, *args):
+        """Run a blocking controller call on the I/O thread and await it."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pico-io")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def _send_command_async(self, command: str) -> str:
+        """Awaitable version of _send_command()."""
+        return await self._run_async(self._send_command, command)
+    
+    async def set_speed_rps_async(self, rps: float) -> bool:
+        """Awaitable version of set_speed_rps()."""
+        return await self._run_async(self.set_speed_rps, rps)
+    
+    async def stop_async(self) -> bool:
+        """Awaitable version of stop()."""
+        return await self._run_async(self.stop)
+    
+    async def get_status_async(self) -> Optional[Tuple[float, float, int]]:
+        """Awaitable version of get_status()."""
+        return await self._run_async(self.get_status)
     
     def close(self):
         """Close serial connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if self.ser and self.ser.is_open:
             self.ser.close()
     
@@ -166,40 +425,46 @@ class PicoStepperController:
 
 
 # ======== Example Usage ========
-if __name__ == "__main__":
+async def main():
     # Connect to Pico (auto-detect port)
     with PicoStepperController() as controller:
         print("Motor controller ready!")
         
-        # Enable motor
-        controller.enable_motor()
-        
-        # Set speed to 2 revolutions per second
+        # Enable motor and set speed to 2 revolutions per second in one round-trip
         print("Setting speed to 2 RPS...")
-        controller.set_speed_rps(2.0)
-        time.sleep(3)
+        with controller.batch():
+            controller.enable_motor()
+            controller.set_speed_rps(2.0)
         
-        # Check status
-        status = controller.get_status()
-        if status:
-            current, target, pos = status
-            print(f"Current: {current:.2f} RPS, Target: {target:.2f} RPS, Position: {pos} steps")
+        # Poll status while the motor ramps; other coroutines keep running
+        # during each serial round-trip
+        for _ in range(6):
+            await asyncio.sleep(0.5)
+            status = await controller.get_status_async()
+            if status:
+                current, target, pos = status
+                print(f"Current: {current:.2f} RPS, Target: {target:.2f} RPS, Position: {pos} steps")
         
         # Change speed
         print("Setting speed to 5 RPS...")
-        controller.set_speed_rps(5.0)
-        time.sleep(3)
+        await controller.set_speed_rps_async(5.0)
+        await asyncio.sleep(3)
         
         # Reverse direction
         print("Reversing direction...")
-        controller.set_speed_rps(-3.0)
-        time.sleep(3)
+        await controller.set_speed_rps_async(-3.0)
+        await asyncio.sleep(3)
         
         # Stop motor
         print("Stopping motor...")
-        controller.stop()
-        time.sleep(2)
+        await controller.stop_async()
+        await asyncio.sleep(2)
         
         # Disable motor
         controller.disable_motor()
-        print("Done!")
\ No newline at end of file
+        print("Done!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
\ No newline at end of file
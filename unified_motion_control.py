@@ -1,19 +1,99 @@
 import sys
+import collections
+import threading
 import time
-import csv
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+import logging
+import queue
+from functools import partial
+from operator import methodcaller
+from types import SimpleNamespace
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGroupBox, QPushButton, QLabel, 
                              QLineEdit, QComboBox, QSlider, QSpinBox, QDoubleSpinBox,
                              QMessageBox, QStatusBar, QGridLayout, QTabWidget,
                              QTableWidget, QTableWidgetItem, QFileDialog, QCheckBox,
-                             QProgressBar, QTextEdit)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
+                             QProgressBar, QTextEdit, QPlainTextEdit)
+from PyQt5.QtCore import QTimer, QElapsedTimer, QEvent, Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
 import serial.tools.list_ports
 
 # Import your controller classes
 from stepper_controller import PicoStepperController
 from lts_controller import ThorlabsLTSController
+from path_scheduler import dirty_axes
+
+log = logging.getLogger(__name__)
+
+# How to open a device and how to describe it in the UI
+DeviceSpec = collections.namedtuple(
+    'DeviceSpec',
+    ['ctor',           # controller class
+     'arg',            # constructor keyword the port/serial input is passed as
+     'input_name',     # what the input holds, for the "please enter" warning
+     'lock_input',     # disable the input while connected
+     'axis',           # axis the device drives
+     'title',          # name used in messages
+     'connected_msg']) # log line on connect, formatted with the input value
+
+# Application stylesheet, applied once to the QApplication in main()
+_APP_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        min-height: 30px;
+        border-radius: 3px;
+        padding: 5px 10px;
+        background-color: #e0e0e0;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+    }
+    QLabel[connState="up"] {
+        color: green;
+        font-weight: bold;
+    }
+    QLabel[connState="down"] {
+        color: red;
+    }
+    QLabel#banner {
+        background-color: #dff0d8;
+        border: 1px solid #a3c293;
+        border-radius: 3px;
+        padding: 6px;
+        font-weight: bold;
+    }
+"""
+
+# Controller method a path value is sent to, by axis type
+_DISPATCH_METHOD = {
+    'linear': 'move_absolute',  # position in mm
+    'rotary': 'set_speed_rps',  # speed in RPS; ramps on the Pico, nothing to wait for
+}
 
 
 # # Mock controllers for demonstration
@@ -64,56 +144,356 @@ from lts_controller import ThorlabsLTSController
 
 class PathExecutionThread(QThread):
     """Thread for executing motion paths"""
-    progress_update = pyqtSignal(int, str)
+    progress_update = pyqtSignal()  # new progress waiting, see take_progress()
     path_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, path_data, controllers, axes_config):
+    PROGRESS_INTERVAL_MS = 50  # between progress reports at the same percentage
+    
+    def __init__(self, path_matrix, axis_order, controllers, axes_config, step_delay_ms=100):
         super().__init__()
-        self.path_data = path_data
+        self.path_matrix = path_matrix  # (n_steps, len(axis_order)) float64
+        self.axis_order = axis_order
         self.controllers = controllers
         self.axes_config = axes_config
-        self.running = True
-        
+        self.step_delay = step_delay_ms / 1000.0
+        self._stop = threading.Event()
+        # Latest (percent, message) not yet shown, and whether the GUI has
+        # already been told about it; at most one notification is queued.
+        # Both change together under _progress_lock.
+        self._pending_progress = None
+        self._progress_posted = False
+        self._progress_lock = threading.Lock()
+        
+    def take_progress(self):
+        """Return the newest (percent, message) and allow the next notification"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+            self._progress_posted = False
+        return pending
+    
+    def _post_progress(self, progress, message):
+        """Replace the pending progress, notifying the GUI unless it already knows"""
+        with self._progress_lock:
+            self._pending_progress = (progress, message)
+            notify = not self._progress_posted
+            self._progress_posted = True
+        if notify:
+            self.progress_update.emit()
+    
     def run(self):
         try:
-            total_steps = len(self.path_data)
-            for i, step in enumerate(self.path_data):
-                if not self.running:
+            total_steps = len(self.path_matrix)
+            
+            # Resolve each axis to its bound controller method once, instead
+            # of looking it up for every step
+            columns = []   # path_matrix column of each dispatched axis
+            dispatch = []  # matching bound controller method
+            waits = []     # matching wait_for_motion_complete, None for rotary axes
+            for j, axis_name in enumerate(self.axis_order):
+                config = self.axes_config[axis_name]
+                controller = self.controllers.get(config['controller'])
+                if controller is None:
+                    continue  # axis not enabled for this run
+                
+                method_name = _DISPATCH_METHOD.get(config['type'])
+                if method_name is None:
+                    continue
+                columns.append(j)
+                dispatch.append(getattr(controller, method_name))
+                waits.append(controller.wait_for_motion_complete
+                             if config['type'] == 'linear' else None)
+            
+            # Rows of Python floats in dispatch order, converted in one pass,
+            # and which of those axes change at each step
+            matrix = self.path_matrix[:, columns]
+            rows = matrix.tolist()
+            dirty_rows = dirty_axes(matrix).tolist()
+            
+            last_progress = -1
+            since_emit = QElapsedTimer()  # time since the last progress report
+            since_emit.start()
+            for i, (row, dirty) in enumerate(zip(rows, dirty_rows)):
+                if self._stop.is_set():
                     break
                 
-                # Execute motion for each axis
-                for axis_name, value in step.items():
-                    if axis_name in self.axes_config:
-                        controller = self.controllers[self.axes_config[axis_name]['controller']]
-                        axis_type = self.axes_config[axis_name]['type']
-                        
-                        if axis_type == 'linear':
-                            controller.move_absolute(float(value))
-                        elif axis_type == 'rotary':
-                            controller.set_speed_rps(float(value))
+                # Start every axis of this step before waiting on any of them,
+                # so the axes move together instead of one after another.
+                # Axes whose value did not change are not commanded again.
+                for fn, value, changed in zip(dispatch, row, dirty):
+                    if changed:
+                        fn(value)
+                
+                # Wait for motion to complete; the controllers are woken by the
+                # device's move-complete notification, so this returns when the
+                # slowest axis arrives
+                for wait_done, changed in zip(waits, dirty):
+                    if changed and wait_done is not None:
+                        wait_done()
                 
-                # Wait for motion to complete
-                self.progress_update.emit(int((i + 1) / total_steps * 100), 
-                                         f"Step {i+1}/{total_steps}")
-                time.sleep(0.1)  # Adjust based on your motion timing
+                # Report progress when the percentage moves, otherwise at most
+                # every PROGRESS_INTERVAL_MS, so short steps don't flood the GUI
+                progress = int((i + 1) / total_steps * 100)
+                if progress != last_progress or since_emit.hasExpired(self.PROGRESS_INTERVAL_MS):
+                    self._post_progress(progress, f"Step {i+1}/{total_steps}")
+                    last_progress = progress
+                    since_emit.restart()
                 
-            self.path_complete.emit()
+                # Dwell at the step (Step Delay setting); stop() cuts it short
+                if self._stop.wait(self.step_delay):
+                    break
+                
+            if not self._stop.is_set():
+                self.path_complete.emit()
         except Exception as e:
             self.error_occurred.emit(str(e))
     
     def stop(self):
-        self.running = False
+        self._stop.set()
+    
+    def stop_requested(self):
+        """True once stop() has been called"""
+        return self._stop.is_set()
+
+
+class ControllerWorker(QThread):
+    """Thread that owns one device controller and runs its commands in order"""
+    connected = pyqtSignal(object)
+    connect_failed = pyqtSignal(str)
+    command_failed = pyqtSignal(str)
+    
+    def __init__(self, factory, name):
+        super().__init__()
+        self.factory = factory
+        self.name = name
+        self.controller = None
+        self._commands = queue.SimpleQueue()
+    
+    def submit(self, command):
+        """Queue command(controller) to run on this thread"""
+        self._commands.put(command)
+    
+    def shutdown(self):
+        """Close the controller once the queued commands have run, then exit"""
+        self._commands.put(None)
+    
+    def run(self):
+        try:
+            self.controller = self.factory()
+        except Exception as e:
+            self.connect_failed.emit(str(e))
+            return
+        self.connected.emit(self.controller)
+        
+        while True:
+            command = self._commands.get()
+            if command is None:
+                break
+            try:
+                command(self.controller)
+            except Exception as e:
+                log.exception("%s command failed", self.name)
+                self.command_failed.emit(f"{self.name} command failed: {e}")
+        
+        try:
+            self.controller.close()
+        except Exception:
+            log.exception("Error closing %s", self.name)
+
+
+class StatusPoller(QThread):
+    """Thread that polls device status and publishes it as one dict per poll"""
+    status_ready = pyqtSignal(dict)
+    
+    def __init__(self, fast_ms=50, idle_ms=1000, read_timeout=0.5):
+        super().__init__()
+        self.fast_ms = fast_ms
+        self.idle_ms = idle_ms
+        self.read_timeout = read_timeout
+        self._reads = {}  # status key -> read callable; replaced, never mutated
+        self._fast_until = 0.0
+        self._paused = False
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+    
+    def set_reads(self, reads):
+        """Replace the set of devices polled, as {status key: read callable}"""
+        self._reads = dict(reads)
+        self._wake.set()
+    
+    def poll_fast(self, hold):
+        """Poll at the fast rate now and for at least `hold` seconds"""
+        self._fast_until = time.monotonic() + hold
+        self._wake.set()
+    
+    def set_paused(self, paused):
+        """Stop reading devices while paused; resume with an immediate poll"""
+        self._paused = paused
+        self._wake.set()
+    
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+    
+    def run(self):
+        # Reads of the different devices run side by side on this pool; a
+        # device whose previous read is still running is skipped instead of
+        # queueing another read behind it
+        pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ctrl-io')
+        pending = {}
+        try:
+            while not self._stop.is_set():
+                reads = self._reads
+                if not reads or self._paused:
+                    self._wake.wait()  # nothing connected, or nobody watching
+                    self._wake.clear()
+                    continue
+                
+                futures = {key: pool.submit(read) for key, read in reads.items()
+                           if key not in pending or pending[key].done()}
+                done, _ = wait(futures.values(), timeout=self.read_timeout)
+                pending = {key: fut for key, fut in {**pending, **futures}.items()
+                           if key in reads and not fut.done()}
+                
+                status = {}
+                busy = False
+                for key, fut in futures.items():
+                    if fut not in done:
+                        continue  # too slow this poll; the label keeps its value
+                    try:
+                        result = fut.result()
+                    except Exception as e:
+                        log.warning("%s status read failed: %s", key, e)
+                        continue
+                    if result is None:
+                        continue
+                    status[key] = result
+                    if key == 'Rotation':
+                        current, target, pos = result
+                        busy = busy or abs(current - target) > 0.01  # still ramping
+                    else:
+                        moving, pos = result
+                        busy = busy or moving
+                
+                if status:
+                    self.status_ready.emit(status)
+                
+                fast = busy or time.monotonic() < self._fast_until
+                self._wake.wait((self.fast_ms if fast else self.idle_ms) / 1000.0)
+                self._wake.clear()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _stop_controller(controller, title, then=None):
+    """Stop one controller, logging instead of raising if the device fails;
+    then(), if given, runs afterwards either way"""
+    try:
+        controller.stop()
+    except Exception:
+        log.exception("Stop failed on %s", title)
+    finally:
+        if then is not None:
+            then()
+
+
+def _readout_label(text, widest):
+    """Bold label for a live value that is rewritten on every status poll.
+    
+    Plain text and no text interaction, so setText skips rich-text
+    detection and the label keeps no selection/cursor state. The label is
+    fixed to the size of `widest`, the longest text it will show, so a new
+    value repaints the label without relaying out the tab around it.
+    """
+    label = QLabel(widest)
+    label.setStyleSheet("font-weight: bold;")
+    label.setTextFormat(Qt.PlainText)
+    label.setTextInteractionFlags(Qt.NoTextInteraction)
+    label.ensurePolished()
+    label.setFixedSize(label.sizeHint())
+    label.setText(text)
+    return label
+
+
+class JogBar(QWidget):
+    """Row of preset buttons for one axis, reported through a single signal"""
+    jogRequested = pyqtSignal(str, float)
+    
+    def __init__(self, axis, distances=(-10, -1, -0.1, 0.1, 1, 10), label="{:+.1f}", parent=None):
+        super().__init__(parent)
+        self._axis = axis
+        self.distances = tuple(distances)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for d in self.distances:
+            # label is a format string, or a callable for irregular labels
+            btn = QPushButton(label(d) if callable(label) else label.format(d))
+            btn.setMaximumWidth(60)
+            btn.clicked.connect(lambda _, d=d: self.jogRequested.emit(self._axis, d))
+            layout.addWidget(btn)
 
 
 class UnifiedMotionControlGUI(QMainWindow):
+    DEVICE_SPECS = {
+        'stepper': DeviceSpec(PicoStepperController, 'port', "a port", False,
+                              'Rotation', "Stepper motor", "Stepper motor connected on {}"),
+        **{f'lts_{axis.lower()}': DeviceSpec(ThorlabsLTSController, 'serial_number', "serial number", True,
+                                             axis, f"{axis}-axis stage",
+                                             f"{axis}-axis stage connected (S/N: {{}})")
+           for axis in ['X', 'Y', 'Z']},
+    }
+    
+    PORT_CACHE_TTL = 2.0  # seconds a serial port scan is reused for
+    POLL_FAST_MS = 50     # status poll interval while an axis is moving
+    POLL_IDLE_MS = 1000   # status poll interval while everything is idle
+    POLL_FAST_HOLD = 0.5  # seconds to keep polling fast after a command
+    STATUS_READ_TIMEOUT = 0.5  # seconds a poll waits for device reads
+    CLOSE_WAIT_MS = 500   # wait on close, shared by all threads, before handing back to the event loop
+    CLOSE_TIMEOUT = 5.0   # seconds after which a close still waiting on threads is logged
+    
+    # Readout formatters, bound once instead of looked up on every poll
+    _RPS_FMT = "%.2f RPS".__mod__
+    _POS_FMT = "%.3f mm".__mod__
+    
     def __init__(self):
         super().__init__()
         self.stepper_controller = None
         self.lts_controllers = {}  # Support multiple LTS stages
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
+        # Same controllers keyed by axis name; None while disconnected
+        self.controllers_by_axis = {'X': None, 'Y': None, 'Z': None, 'Rotation': None}
+        
+        # Device status is read on its own thread and delivered to _apply_status
+        self.status_poller = StatusPoller(self.POLL_FAST_MS, self.POLL_IDLE_MS,
+                                          self.STATUS_READ_TIMEOUT)
+        self.status_poller.status_ready.connect(self._apply_status)
+        self.status_poller.start()
+        self._last_display = {}  # label key -> text last shown, see _set_label_text
+        self._poll_plan = ()  # (status key, label, result field, formatter) per polled device, see _set_controller
+        
         self.path_thread = None
+        self._close_started = None  # monotonic time of the first close attempt
+        self._close_overdue = False  # CLOSE_TIMEOUT passed and was logged
+        self._last_progress = -1  # progress bar value last shown
+        self.workers = {}  # device key -> ControllerWorker, while connected
+        self._retired_workers = set()  # disconnected workers still closing
+        self._ports_cache = ([], float('-inf'))  # (port names, monotonic scan time)
+        
+        # Log lines are queued by log_event and appended in one batch per tick
+        self._log_queue = collections.deque(maxlen=2000)
+        self._ts_cache_sec = 0  # log timestamp reused within the same second
+        self._ts_cache_str = ""
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(100)
+        
+        # Loaded path: the axis columns as one (steps, axes) float64 matrix,
+        # plus the first rows of every CSV column for the preview table
+        self.path_matrix = None
+        self.path_axis_order = []
+        self.path_headers = []
+        self.path_preview_rows = []
+        self.path_len = 0
         
         # Axis configuration
         self.axes_config = {
@@ -134,22 +514,72 @@ class UnifiedMotionControlGUI(QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         
+        # Non-modal notification banner, hidden again by _banner_timer
+        self.banner = QLabel()
+        self.banner.setObjectName("banner")
+        self.banner.hide()
+        main_layout.addWidget(self.banner)
+        self._banner_timer = QTimer(self)
+        self._banner_timer.setSingleShot(True)
+        self._banner_timer.timeout.connect(self.banner.hide)
+        
+        # Tab pages whose contents are built on first use, see _lazy_tab
+        self._tab_builders = {}
+        
+        # Per-axis widget table, filled in by the tab builders
+        self.axis_widgets = {axis: SimpleNamespace() for axis in ['X', 'Y', 'Z']}
+        
         # Create tab widget
         self.tabs = QTabWidget()
         self.tabs.addTab(self.create_connection_tab(), "Connection")
         self.tabs.addTab(self.create_manual_control_tab(), "Manual Control")
-        self.tabs.addTab(self.create_path_control_tab(), "Path Execution")
+        self.tabs.addTab(self._lazy_tab(self.create_path_control_tab), "Path Execution")
         self.tabs.addTab(self.create_status_tab(), "Status Monitoring")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         main_layout.addWidget(self.tabs)
         
+        # Widgets each device's connect/disconnect updates, by device key
+        self.device_widgets = {
+            'stepper': SimpleNamespace(input=self.stepper_port_combo,
+                                       read_input=self.stepper_port_combo.currentText,
+                                       connect_btn=self.stepper_connect_btn,
+                                       status_label=self.stepper_status_label,
+                                       enables=[self.stepper_enable_btn]),
+        }
+        for axis, w in self.axis_widgets.items():
+            self.device_widgets[f'lts_{axis.lower()}'] = SimpleNamespace(
+                input=w.serial_input,
+                read_input=w.serial_input.text,
+                connect_btn=w.connect_btn,
+                status_label=w.status_label,
+                enables=[w.home_btn, w.move_abs_btn, w.move_rel_btn, w.jog_bar])
+        
         # Status bar
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage('System Disconnected')
         
-        self.apply_style()
-        
+        # Path error dialog, built once and shown with open() so it does not
+        # run a nested event loop
+        self._path_error_box = QMessageBox(QMessageBox.Critical, "Execution Error", "",
+                                           QMessageBox.Ok, self)
+        
+    def _lazy_tab(self, builder):
+        """Empty tab page that is filled in by builder when first shown"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_builders[page] = builder
+        return page
+    
+    def _ensure_tab_built(self, index):
+        """Build a lazy tab's contents the first time it is selected"""
+        page = self.tabs.widget(index)
+        builder = self._tab_builders.pop(page, None)
+        if builder is not None:
+            page.layout().addWidget(builder())
+    
     def create_connection_tab(self):
         """Tab for device connections"""
         widget = QWidget()
@@ -164,11 +594,11 @@ class UnifiedMotionControlGUI(QMainWindow):
         stepper_layout.addWidget(self.stepper_port_combo)
         
         self.stepper_connect_btn = QPushButton("Connect")
-        self.stepper_connect_btn.clicked.connect(lambda: self.toggle_connection('stepper'))
+        self.stepper_connect_btn.clicked.connect(partial(self.toggle_connection, 'stepper'))
         stepper_layout.addWidget(self.stepper_connect_btn)
         
         self.stepper_enable_btn = QPushButton("Enable")
-        self.stepper_enable_btn.clicked.connect(lambda: self.toggle_motor('stepper'))
+        self.stepper_enable_btn.clicked.connect(partial(self.toggle_motor, 'stepper'))
         self.stepper_enable_btn.setEnabled(False)
         stepper_layout.addWidget(self.stepper_enable_btn)
         
@@ -178,6 +608,7 @@ class UnifiedMotionControlGUI(QMainWindow):
         
         # Linear Stage Connections (X, Y, Z)
         for axis in ['X', 'Y', 'Z']:
+            w = self.axis_widgets[axis]
             axis_group = QGroupBox(f"{axis}-Axis Linear Stage (Thorlabs LTS)")
             axis_layout = QHBoxLayout()
             
@@ -185,23 +616,23 @@ class UnifiedMotionControlGUI(QMainWindow):
             serial_input = QLineEdit()
             serial_input.setPlaceholderText("e.g., 45123456")
             serial_input.setMaximumWidth(150)
-            setattr(self, f'lts_{axis.lower()}_serial_input', serial_input)
+            w.serial_input = serial_input
             axis_layout.addWidget(serial_input)
             
             connect_btn = QPushButton("Connect")
-            connect_btn.clicked.connect(lambda checked, a=axis: self.toggle_connection(f'lts_{a.lower()}'))
-            setattr(self, f'lts_{axis.lower()}_connect_btn', connect_btn)
+            connect_btn.clicked.connect(partial(self.toggle_connection, f'lts_{axis.lower()}'))
+            w.connect_btn = connect_btn
             axis_layout.addWidget(connect_btn)
             
             home_btn = QPushButton("Home")
-            home_btn.clicked.connect(lambda checked, a=axis: self.home_axis(a))
+            home_btn.clicked.connect(partial(self.home_axis, axis))
             home_btn.setEnabled(False)
-            setattr(self, f'lts_{axis.lower()}_home_btn', home_btn)
+            w.home_btn = home_btn
             axis_layout.addWidget(home_btn)
             
             enable_check = QCheckBox("Enable for Path")
-            enable_check.stateChanged.connect(lambda state, a=axis: self.toggle_axis_enable(a, state))
-            setattr(self, f'axis_{axis.lower()}_enable', enable_check)
+            enable_check.stateChanged.connect(partial(self.toggle_axis_enable, axis))
+            w.enable_check = enable_check
             axis_layout.addWidget(enable_check)
             
             axis_layout.addStretch()
@@ -246,13 +677,14 @@ class UnifiedMotionControlGUI(QMainWindow):
         linear_layout = QGridLayout()
         
         for i, axis in enumerate(['X', 'Y', 'Z']):
+            w = self.axis_widgets[axis]
+            
             # Axis label
             linear_layout.addWidget(QLabel(f"{axis}-Axis:"), i, 0)
             
             # Current position
-            pos_label = QLabel("0.00 mm")
-            pos_label.setStyleSheet("font-weight: bold;")
-            setattr(self, f'{axis.lower()}_pos_label', pos_label)
+            pos_label = _readout_label("0.00 mm", "-1000.000 mm")
+            w.pos_label = pos_label
             linear_layout.addWidget(pos_label, i, 1)
             
             # Target position
@@ -262,34 +694,28 @@ class UnifiedMotionControlGUI(QMainWindow):
             target_input.setSingleStep(0.1)
             target_input.setDecimals(3)
             target_input.setSuffix(" mm")
-            setattr(self, f'{axis.lower()}_target_input', target_input)
+            w.target_input = target_input
             linear_layout.addWidget(target_input, i, 3)
             
             # Move buttons
             move_abs_btn = QPushButton("Move Absolute")
-            move_abs_btn.clicked.connect(lambda checked, a=axis: self.move_absolute(a))
+            move_abs_btn.clicked.connect(partial(self.move_absolute, axis))
             move_abs_btn.setEnabled(False)
-            setattr(self, f'{axis.lower()}_move_abs_btn', move_abs_btn)
+            w.move_abs_btn = move_abs_btn
             linear_layout.addWidget(move_abs_btn, i, 4)
             
             move_rel_btn = QPushButton("Move Relative")
-            move_rel_btn.clicked.connect(lambda checked, a=axis: self.move_relative(a))
+            move_rel_btn.clicked.connect(partial(self.move_relative, axis))
             move_rel_btn.setEnabled(False)
-            setattr(self, f'{axis.lower()}_move_rel_btn', move_rel_btn)
+            w.move_rel_btn = move_rel_btn
             linear_layout.addWidget(move_rel_btn, i, 5)
             
             # Quick jog buttons
-            jog_layout = QHBoxLayout()
-            for dist in [-10, -1, -0.1, 0.1, 1, 10]:
-                jog_btn = QPushButton(f"{dist:+.1f}")
-                jog_btn.setMaximumWidth(60)
-                jog_btn.clicked.connect(lambda checked, a=axis, d=dist: self.jog_axis(a, d))
-                jog_btn.setEnabled(False)
-                jog_layout.addWidget(jog_btn)
-                if not hasattr(self, f'{axis.lower()}_jog_buttons'):
-                    setattr(self, f'{axis.lower()}_jog_buttons', [])
-                getattr(self, f'{axis.lower()}_jog_buttons').append(jog_btn)
-            linear_layout.addLayout(jog_layout, i, 6)
+            jog_bar = JogBar(axis)
+            jog_bar.jogRequested.connect(self.jog_axis)
+            jog_bar.setEnabled(False)
+            w.jog_bar = jog_bar
+            linear_layout.addWidget(jog_bar, i, 6)
         
         linear_group.setLayout(linear_layout)
         layout.addWidget(linear_group)
@@ -299,8 +725,7 @@ class UnifiedMotionControlGUI(QMainWindow):
         rotary_layout = QGridLayout()
         
         rotary_layout.addWidget(QLabel("Current Speed:"), 0, 0)
-        self.rotation_speed_label = QLabel("0.00 RPS")
-        self.rotation_speed_label.setStyleSheet("font-weight: bold;")
+        self.rotation_speed_label = _readout_label("0.00 RPS", "-00.00 RPS")
         rotary_layout.addWidget(self.rotation_speed_label, 0, 1)
         
         rotary_layout.addWidget(QLabel("Target Speed:"), 1, 0)
@@ -318,17 +743,11 @@ class UnifiedMotionControlGUI(QMainWindow):
         
         # Quick rotation speeds
         rotary_layout.addWidget(QLabel("Quick Speeds:"), 2, 0)
-        quick_layout = QHBoxLayout()
-        for speed in [0, 1, 2, 5, 10, -1, -2, -5]:
-            btn = QPushButton(f"{speed:+.0f}" if speed != 0 else "Stop")
-            btn.setMaximumWidth(60)
-            btn.clicked.connect(lambda checked, s=speed: self.quick_rotation(s))
-            btn.setEnabled(False)
-            if not hasattr(self, 'rotation_quick_buttons'):
-                self.rotation_quick_buttons = []
-            self.rotation_quick_buttons.append(btn)
-            quick_layout.addWidget(btn)
-        rotary_layout.addLayout(quick_layout, 2, 1, 1, 2)
+        self.rotation_quick_bar = JogBar('Rotation', (0, 1, 2, 5, 10, -1, -2, -5),
+                                         label=lambda s: f"{s:+.0f}" if s != 0 else "Stop")
+        self.rotation_quick_bar.jogRequested.connect(lambda _axis, speed: self.quick_rotation(speed))
+        self.rotation_quick_bar.setEnabled(False)
+        rotary_layout.addWidget(self.rotation_quick_bar, 2, 1, 1, 2)
         
         rotary_group.setLayout(rotary_layout)
         layout.addWidget(rotary_group)
@@ -352,6 +771,7 @@ class UnifiedMotionControlGUI(QMainWindow):
     def create_path_control_tab(self):
         """Tab for CSV path execution"""
         widget = QWidget()
+        self.path_tab = widget
         layout = QVBoxLayout(widget)
         
         # File loading
@@ -376,6 +796,7 @@ class UnifiedMotionControlGUI(QMainWindow):
         
         self.path_table = QTableWidget()
         self.path_table.setMaximumHeight(200)
+        self._preview_items = []  # cell items of path_table, by row then column
         preview_layout.addWidget(self.path_table)
         
         preview_group.setLayout(preview_layout)
@@ -449,7 +870,7 @@ class UnifiedMotionControlGUI(QMainWindow):
         for i, axis in enumerate(['X', 'Y', 'Z'], 1):
             status_layout.addWidget(QLabel(f"{axis}-Axis Stage:"), i, 0)
             label = QLabel("Disconnected")
-            setattr(self, f'lts_{axis.lower()}_status_label', label)
+            self.axis_widgets[axis].status_label = label
             status_layout.addWidget(label, i, 1)
         
         status_group.setLayout(status_layout)
@@ -459,13 +880,15 @@ class UnifiedMotionControlGUI(QMainWindow):
         log_group = QGroupBox("Event Log")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)  # no undo history per append
         self.log_text.setMaximumHeight(300)
+        self.log_text.setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_text)
         
         clear_log_btn = QPushButton("Clear Log")
-        clear_log_btn.clicked.connect(lambda: self.log_text.clear())
+        clear_log_btn.clicked.connect(self.log_text.clear)
         log_layout.addWidget(clear_log_btn)
         
         log_group.setLayout(log_layout)
@@ -476,10 +899,23 @@ class UnifiedMotionControlGUI(QMainWindow):
     
     def refresh_ports(self):
         """Refresh available serial ports for stepper only"""
-        ports = [port.device for port in serial.tools.list_ports.comports()]
-        
-        self.stepper_port_combo.clear()
-        self.stepper_port_combo.addItems(ports if ports else ["No ports found"])
+        # Port enumeration is slow on Windows; reuse a recent scan
+        ports, scanned_at = self._ports_cache
+        now = time.monotonic()
+        if now - scanned_at > self.PORT_CACHE_TTL:
+            ports = [port.device for port in serial.tools.list_ports.comports()]
+            self._ports_cache = (ports, now)
+        
+        # Only touch the combo when the list changed, keeping the selection
+        items = ports if ports else ["No ports found"]
+        combo = self.stepper_port_combo
+        if [combo.itemText(i) for i in range(combo.count())] != items:
+            current = combo.currentText()
+            combo.clear()
+            combo.addItems(items)
+            index = combo.findText(current)
+            if index >= 0:
+                combo.setCurrentIndex(index)
     
     def list_kinesis_devices(self):
         """List available Kinesis devices by serial number"""
@@ -518,89 +954,132 @@ class UnifiedMotionControlGUI(QMainWindow):
     
     def toggle_connection(self, device):
         """Connect/disconnect devices"""
+        if device in self.workers:
+            self._disconnect_device(device)
+            return
+        
+        spec = self.DEVICE_SPECS[device]
+        w = self.device_widgets[device]
+        value = w.read_input().strip()
+        if not value:
+            QMessageBox.warning(self, "Error", f"Please enter {spec.input_name} for {spec.title}")
+            return
+        
+        w.connect_btn.setEnabled(False)
+        w.connect_btn.setText("Connecting...")
+        if spec.lock_input:
+            w.input.setEnabled(False)
+        
+        # The controller is opened on the worker thread, so a slow or
+        # unresponsive device never freezes the window
+        worker = ControllerWorker(partial(spec.ctor, **{spec.arg: value}), device)
+        worker.connected.connect(partial(self._on_device_connected, device, worker, value))
+        worker.connect_failed.connect(partial(self._on_device_connect_failed, device, worker))
+        worker.command_failed.connect(self.log_event)
+        self.workers[device] = worker
+        worker.start()
+    
+    def _on_device_connected(self, device, worker, value, controller):
+        """Worker opened its controller; enable the matching controls"""
+        if self.workers.get(device) is not worker:
+            return  # disconnected again while the open was in progress
+        
+        spec = self.DEVICE_SPECS[device]
+        w = self.device_widgets[device]
+        self._set_controller(device, controller)
+        w.connect_btn.setEnabled(True)
+        w.connect_btn.setText("Disconnect")
+        for widget in w.enables:
+            widget.setEnabled(True)
+        self._set_conn_state(w.status_label, True)
+        self.log_event(spec.connected_msg.format(value))
+        self._poll_fast()
+    
+    def _on_device_connect_failed(self, device, worker, error):
+        """Worker could not open its controller; reset the connect controls"""
+        if self.workers.get(device) is not worker:
+            return
+        self._retire_worker(device)
+        
+        spec = self.DEVICE_SPECS[device]
+        w = self.device_widgets[device]
+        w.connect_btn.setEnabled(True)
+        w.connect_btn.setText("Connect")
+        w.input.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to connect {spec.title}:\n{error}")
+    
+    def _disconnect_device(self, device):
+        """Hand the controller back to its worker to close, and reset the controls"""
+        self._retire_worker(device).shutdown()
+        
+        spec = self.DEVICE_SPECS[device]
+        w = self.device_widgets[device]
+        self._set_controller(device, None)
+        w.connect_btn.setEnabled(True)
+        w.connect_btn.setText("Connect")
+        for widget in w.enables:
+            widget.setEnabled(False)
+        self._set_conn_state(w.status_label, False)
+        w.input.setEnabled(True)
+        self.log_event(f"{spec.title} disconnected")
+    
+    def _set_controller(self, device, controller):
+        """Record a device's controller (None when disconnected) everywhere it is looked up"""
         if device == 'stepper':
-            if self.stepper_controller is None:
-                try:
-                    port = self.stepper_port_combo.currentText()
-                    self.stepper_controller = PicoStepperController(port=port)
-                    self.stepper_connect_btn.setText("Disconnect")
-                    self.stepper_enable_btn.setEnabled(True)
-                    self.stepper_status_label.setText("Connected")
-                    self.stepper_status_label.setStyleSheet("color: green; font-weight: bold;")
-                    self.log_event(f"Stepper motor connected on {port}")
-                    self.update_timer.start(100)
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to connect stepper: {e}")
-            else:
-                self.stepper_controller.close()
-                self.stepper_controller = None
-                self.stepper_connect_btn.setText("Connect")
-                self.stepper_enable_btn.setEnabled(False)
-                self.stepper_status_label.setText("Disconnected")
-                self.stepper_status_label.setStyleSheet("color: red;")
-                self.log_event("Stepper motor disconnected")
-        
-        elif device.startswith('lts_'):
-            axis = device.split('_')[1].upper()
-            controller_key = f'lts_{axis.lower()}'
-            
-            if controller_key not in self.lts_controllers:
-                try:
-                    serial_number = getattr(self, f'lts_{axis.lower()}_serial_input').text().strip()
-                    if not serial_number:
-                        QMessageBox.warning(self, "Error", f"Please enter serial number for {axis}-axis")
-                        return
-                    
-                    self.lts_controllers[controller_key] = ThorlabsLTSController(serial_number=serial_number)
-                    getattr(self, f'lts_{axis.lower()}_connect_btn').setText("Disconnect")
-                    getattr(self, f'lts_{axis.lower()}_home_btn').setEnabled(True)
-                    getattr(self, f'lts_{axis.lower()}_status_label').setText("Connected")
-                    getattr(self, f'lts_{axis.lower()}_status_label').setStyleSheet("color: green; font-weight: bold;")
-                    getattr(self, f'lts_{axis.lower()}_serial_input').setEnabled(False)
-                    
-                    # Enable manual controls
-                    getattr(self, f'{axis.lower()}_move_abs_btn').setEnabled(True)
-                    getattr(self, f'{axis.lower()}_move_rel_btn').setEnabled(True)
-                    for btn in getattr(self, f'{axis.lower()}_jog_buttons'):
-                        btn.setEnabled(True)
-                    
-                    self.log_event(f"{axis}-axis stage connected (S/N: {serial_number})")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to connect {axis}-axis:\n{str(e)}")
-            else:
-                self.lts_controllers[controller_key].close()
-                del self.lts_controllers[controller_key]
-                getattr(self, f'lts_{axis.lower()}_connect_btn').setText("Connect")
-                getattr(self, f'lts_{axis.lower()}_home_btn').setEnabled(False)
-                getattr(self, f'lts_{axis.lower()}_status_label').setText("Disconnected")
-                getattr(self, f'lts_{axis.lower()}_status_label').setStyleSheet("color: red;")
-                getattr(self, f'lts_{axis.lower()}_serial_input').setEnabled(True)
-                
-                # Disable manual controls
-                getattr(self, f'{axis.lower()}_move_abs_btn').setEnabled(False)
-                getattr(self, f'{axis.lower()}_move_rel_btn').setEnabled(False)
-                for btn in getattr(self, f'{axis.lower()}_jog_buttons'):
-                    btn.setEnabled(False)
-                
-                self.log_event(f"{axis}-axis stage disconnected")
+            self.stepper_controller = controller
+        elif controller is not None:
+            self.lts_controllers[device] = controller
+        else:
+            self.lts_controllers.pop(device, None)
+        self.controllers_by_axis[self.DEVICE_SPECS[device].axis] = controller
+        
+        # Poll the stepper's speed and each stage's position, and bind each
+        # result to the label and format it is shown with. Membership only
+        # changes here, so the plan is rebuilt now rather than on every poll.
+        reads = {}
+        plan = []
+        if self.stepper_controller is not None:
+            reads['Rotation'] = self.stepper_controller.get_status
+            plan.append(('Rotation', self.rotation_speed_label, 0, self._RPS_FMT))  # current rps
+        for key, lts in self.lts_controllers.items():
+            axis = self.DEVICE_SPECS[key].axis
+            reads[axis] = lts.snapshot
+            plan.append((axis, self.axis_widgets[axis].pos_label, 1, self._POS_FMT))  # position
+        self._poll_plan = tuple(plan)
+        self.status_poller.set_reads(reads)
+    
+    def _retire_worker(self, device):
+        """Stop tracking a device's worker, keeping it referenced until its thread ends"""
+        worker = self.workers.pop(device)
+        self._retired_workers.add(worker)
+        worker.finished.connect(partial(self._retired_workers.discard, worker))
+        if worker.isFinished():
+            self._retired_workers.discard(worker)
+        return worker
+    
+    def _submit(self, axis, command):
+        """Queue command(controller) on the axis's worker; False if not connected"""
+        if self.controllers_by_axis[axis] is None:
+            return False
+        self.workers[self.axes_config[axis]['controller']].submit(command)
+        self._poll_fast()
+        return True
     
     def toggle_motor(self, device):
         """Enable/disable motors"""
         if device == 'stepper' and self.stepper_controller:
             if self.stepper_enable_btn.text() == "Enable":
-                self.stepper_controller.enable_motor()
+                self._submit('Rotation', methodcaller('enable_motor'))
                 self.stepper_enable_btn.setText("Disable")
                 self.rotation_set_btn.setEnabled(True)
                 self.estop_btn.setEnabled(True)
-                for btn in self.rotation_quick_buttons:
-                    btn.setEnabled(True)
+                self.rotation_quick_bar.setEnabled(True)
                 self.log_event("Stepper motor enabled")
             else:
-                self.stepper_controller.disable_motor()
+                self._submit('Rotation', methodcaller('disable_motor'))
                 self.stepper_enable_btn.setText("Enable")
                 self.rotation_set_btn.setEnabled(False)
-                for btn in self.rotation_quick_buttons:
-                    btn.setEnabled(False)
+                self.rotation_quick_bar.setEnabled(False)
                 self.log_event("Stepper motor disabled")
     
     def toggle_axis_enable(self, axis, state):
@@ -610,39 +1089,30 @@ class UnifiedMotionControlGUI(QMainWindow):
     
     def home_axis(self, axis):
         """Home a linear stage"""
-        controller_key = f'lts_{axis.lower()}'
-        if controller_key in self.lts_controllers:
-            self.lts_controllers[controller_key].home()
+        if self._submit(axis, methodcaller('home')):
             self.log_event(f"{axis}-axis homing initiated")
     
     def move_absolute(self, axis):
         """Move axis to absolute position"""
-        controller_key = f'lts_{axis.lower()}'
-        if controller_key in self.lts_controllers:
-            target = getattr(self, f'{axis.lower()}_target_input').value()
-            self.lts_controllers[controller_key].move_absolute(target)
+        target = self.axis_widgets[axis].target_input.value()
+        if self._submit(axis, methodcaller('move_absolute', target)):
             self.log_event(f"{axis}-axis moving to {target:.3f} mm (absolute)")
     
     def move_relative(self, axis):
         """Move axis by relative distance"""
-        controller_key = f'lts_{axis.lower()}'
-        if controller_key in self.lts_controllers:
-            distance = getattr(self, f'{axis.lower()}_target_input').value()
-            self.lts_controllers[controller_key].move_relative(distance)
+        distance = self.axis_widgets[axis].target_input.value()
+        if self._submit(axis, methodcaller('move_relative', distance)):
             self.log_event(f"{axis}-axis moving {distance:+.3f} mm (relative)")
     
     def jog_axis(self, axis, distance):
         """Quick jog axis by small amount"""
-        controller_key = f'lts_{axis.lower()}'
-        if controller_key in self.lts_controllers:
-            self.lts_controllers[controller_key].move_relative(distance)
+        if self._submit(axis, methodcaller('move_relative', distance)):
             self.log_event(f"{axis}-axis jogged {distance:+.3f} mm")
     
     def set_rotation_speed(self):
         """Set stepper rotation speed"""
-        if self.stepper_controller:
-            speed = self.rotation_target_input.value()
-            self.stepper_controller.set_speed_rps(speed)
+        speed = self.rotation_target_input.value()
+        if self._submit('Rotation', methodcaller('set_speed_rps', speed)):
             self.log_event(f"Rotation speed set to {speed:.2f} RPS")
     
     def quick_rotation(self, speed):
@@ -650,12 +1120,33 @@ class UnifiedMotionControlGUI(QMainWindow):
         self.rotation_target_input.setValue(speed)
         self.set_rotation_speed()
     
+    def _stop_devices(self, controllers=None, then=None):
+        """Stop controllers ({device key: controller}, default every connected
+        one), each on its own short-lived thread, then run then[device] there.
+        
+        Not queued on the workers, so a stop is never held up behind a long
+        command such as a home, and not run here, so the GUI thread never
+        waits on device I/O (a Kinesis stop blocks until the stage has
+        decelerated). Returns the started threads.
+        """
+        if controllers is None:
+            controllers = dict(self.lts_controllers)
+            if self.stepper_controller:
+                controllers['stepper'] = self.stepper_controller
+        threads = []
+        for device, controller in controllers.items():
+            thread = threading.Thread(target=_stop_controller,
+                                      args=(controller, self.DEVICE_SPECS[device].title,
+                                            (then or {}).get(device)),
+                                      name=f"stop-{device}", daemon=True)
+            thread.start()
+            threads.append(thread)
+        return threads
+    
     def emergency_stop_all(self):
         """Emergency stop all axes"""
-        if self.stepper_controller:
-            self.stepper_controller.stop()
-        for controller in self.lts_controllers.values():
-            controller.stop()
+        self._stop_devices()
+        self._poll_fast()
         self.log_event("EMERGENCY STOP - All axes halted")
         QMessageBox.warning(self, "Emergency Stop", "All axes have been stopped!")
     
@@ -665,35 +1156,81 @@ class UnifiedMotionControlGUI(QMainWindow):
         if file_path:
             try:
                 with open(file_path, 'r') as f:
-                    reader = csv.DictReader(f)
-                    self.path_data = list(reader)
+                    lines = [line for line in f
+                             if line.strip() and not line.lstrip().startswith('#')]
+                if len(lines) < 2:
+                    raise ValueError("file has no path steps")
+                
+                headers = [h.strip() for h in lines[0].split(',')]
+                matrix = np.loadtxt(lines[1:], delimiter=',', dtype=np.float64, ndmin=2)
+                if matrix.shape[1] != len(headers):
+                    raise ValueError(f"expected {len(headers)} columns, got {matrix.shape[1]}")
+                
+                axis_order = [h for h in headers if h in self.axes_config]
+                if not axis_order:
+                    raise ValueError("no column is named after an axis "
+                                     f"({', '.join(self.axes_config)})")
+                
+                self.path_axis_order = axis_order
+                self.path_matrix = np.ascontiguousarray(
+                    matrix[:, [headers.index(h) for h in axis_order]])
+                self.path_headers = headers
+                self.path_preview_rows = matrix[:10].tolist()
+                self.path_len = matrix.shape[0]
                 
                 self.path_file_input.setText(file_path)
                 self.display_path_preview()
                 self.execute_btn.setEnabled(True)
-                self.log_event(f"Loaded path file: {file_path} ({len(self.path_data)} steps)")
+                self.log_event(f"Loaded path file: {file_path} ({self.path_len} steps)")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load file:\n{e}")
     
     def display_path_preview(self):
         """Display path data in table"""
-        if not hasattr(self, 'path_data') or not self.path_data:
+        if not self.path_len:
             return
         
-        headers = list(self.path_data[0].keys())
-        self.path_table.setColumnCount(len(headers))
-        self.path_table.setHorizontalHeaderLabels(headers)
-        self.path_table.setRowCount(min(10, len(self.path_data)))
-        
-        for i, row in enumerate(self.path_data[:10]):
-            for j, header in enumerate(headers):
-                self.path_table.setItem(i, j, QTableWidgetItem(str(row[header])))
-        
-        self.path_table.resizeColumnsToContents()
+        # Fill the table with signals, sorting and repaints off, then lay it
+        # out once, instead of once per cell
+        table = self.path_table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            headers = self.path_headers
+            rows = self.path_preview_rows
+            
+            # Reuse the cell items from the last load when the shape matches;
+            # only rebuild the grid when it changed
+            items = self._preview_items
+            if len(items) != len(rows) or (items and len(items[0]) != len(headers)):
+                table.setColumnCount(len(headers))
+                table.setRowCount(len(rows))
+                items = []
+                for i in range(len(rows)):
+                    row_items = []
+                    for j in range(len(headers)):
+                        item = QTableWidgetItem()
+                        table.setItem(i, j, item)
+                        row_items.append(item)
+                    items.append(row_items)
+                self._preview_items = items
+            
+            table.setHorizontalHeaderLabels(headers)
+            for row_items, row in zip(items, rows):
+                for item, value in zip(row_items, row):
+                    item.setText(str(value))
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        
+        table.resizeColumnsToContents()
     
     def execute_path(self):
         """Execute the loaded path"""
-        if not hasattr(self, 'path_data') or not self.path_data:
+        if not self.path_len:
             QMessageBox.warning(self, "No Path", "Please load a path file first")
             return
         
@@ -701,11 +1238,9 @@ class UnifiedMotionControlGUI(QMainWindow):
         active_controllers = {}
         for axis, config in self.axes_config.items():
             if config['enabled']:
-                controller_key = config['controller']
-                if controller_key == 'stepper' and self.stepper_controller:
-                    active_controllers[controller_key] = self.stepper_controller
-                elif controller_key.startswith('lts_') and controller_key in self.lts_controllers:
-                    active_controllers[controller_key] = self.lts_controllers[controller_key]
+                controller = self.controllers_by_axis[axis]
+                if controller is not None:
+                    active_controllers[config['controller']] = controller
                 else:
                     QMessageBox.warning(self, "Controller Error", 
                                       f"{axis} axis is enabled but controller is not connected")
@@ -716,16 +1251,21 @@ class UnifiedMotionControlGUI(QMainWindow):
             return
         
         # Start path execution thread
-        self.path_thread = PathExecutionThread(self.path_data, active_controllers, self.axes_config)
-        self.path_thread.progress_update.connect(self.update_path_progress)
+        self.path_thread = PathExecutionThread(self.path_matrix, self.path_axis_order,
+                                               active_controllers, self.axes_config,
+                                               self.step_delay.value())
+        self.path_thread.progress_update.connect(self.update_path_progress, Qt.QueuedConnection)
         self.path_thread.path_complete.connect(self.path_execution_complete)
         self.path_thread.error_occurred.connect(self.path_execution_error)
         
+        self._last_progress = -1
         self.path_thread.start()
+        self._poll_fast()
         
-        self.execute_btn.setEnabled(False)
-        self.pause_btn.setEnabled(True)
-        self.stop_path_btn.setEnabled(True)
+        with self._batched(self.path_tab):
+            self.execute_btn.setEnabled(False)
+            self.pause_btn.setEnabled(True)
+            self.stop_path_btn.setEnabled(True)
         self.log_event("Path execution started")
     
     def pause_path(self):
@@ -736,125 +1276,223 @@ class UnifiedMotionControlGUI(QMainWindow):
     def stop_path(self):
         """Stop path execution"""
         if self.path_thread and self.path_thread.isRunning():
+            # Stopping the driven axes ends the step's wait for motion, so the
+            # thread exits promptly; the controls are reset once it has
             self.path_thread.stop()
-            self.path_thread.wait()
-        
-        self.execute_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.stop_path_btn.setEnabled(False)
-        self.progress_bar.setValue(0)
-        self.progress_label.setText("Path stopped")
+            self._stop_devices(self.path_thread.controllers)
+            self.path_thread.finished.connect(self._path_stopped)
+            self.stop_path_btn.setEnabled(False)
+            self.progress_label.setText("Stopping path...")
+            if self.path_thread.isFinished():
+                self._path_stopped()  # exited before finished was connected
+        else:
+            self._path_stopped()
+    
+    def _path_stopped(self):
+        """Reset the path controls after a stopped path thread has exited"""
+        if self.path_thread is not None:
+            self.path_thread.take_progress()  # drop a report still queued
+        self._last_progress = 0
+        with self._batched(self.path_tab):
+            self.execute_btn.setEnabled(True)
+            self.pause_btn.setEnabled(False)
+            self.stop_path_btn.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self.progress_label.setText("Path stopped")
         self.log_event("Path execution stopped")
     
-    def update_path_progress(self, progress, message):
+    def update_path_progress(self):
         """Update path execution progress"""
-        self.progress_bar.setValue(progress)
+        # Show only the newest report; anything older was superseded while
+        # this notification sat in the queue. A stopped or finished run has
+        # already set its final state, which a late report must not overwrite.
+        thread = self.path_thread
+        if thread is None or thread.stop_requested() or thread.isFinished():
+            return
+        pending = thread.take_progress()
+        if pending is None:
+            return
+        progress, message = pending
+        if progress != self._last_progress:
+            self.progress_bar.setValue(progress)
+            self._last_progress = progress
         self.progress_label.setText(message)
     
     def path_execution_complete(self):
         """Handle path execution completion"""
-        self.execute_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.stop_path_btn.setEnabled(False)
-        self.progress_bar.setValue(100)
-        self.progress_label.setText("Path completed successfully")
+        with self._batched(self.path_tab):
+            self.execute_btn.setEnabled(True)
+            self.pause_btn.setEnabled(False)
+            self.stop_path_btn.setEnabled(False)
+            self.progress_bar.setValue(100)
+            self.progress_label.setText("Path completed successfully")
         self.log_event("Path execution completed")
-        QMessageBox.information(self, "Complete", "Path execution finished!")
+        self._show_banner("Path execution finished!")
     
     def path_execution_error(self, error_msg):
         """Handle path execution error"""
-        self.execute_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.stop_path_btn.setEnabled(False)
+        with self._batched(self.path_tab):
+            self.execute_btn.setEnabled(True)
+            self.pause_btn.setEnabled(False)
+            self.stop_path_btn.setEnabled(False)
         self.log_event(f"Path execution error: {error_msg}")
-        QMessageBox.critical(self, "Execution Error", f"Path execution failed:\n{error_msg}")
-    
-    def update_status(self):
-        """Update real-time status displays"""
-        # Update stepper status
-        if self.stepper_controller:
-            status = self.stepper_controller.get_status()
-            if status:
-                current, target, pos = status
-                self.rotation_speed_label.setText(f"{current:.2f} RPS")
-        
-        # Update linear stage positions
-        for axis in ['X', 'Y', 'Z']:
-            controller_key = f'lts_{axis.lower()}'
-            if controller_key in self.lts_controllers:
-                pos = self.lts_controllers[controller_key].get_position()
-                getattr(self, f'{axis.lower()}_pos_label').setText(f"{pos:.3f} mm")
+        self._path_error_box.setText(f"Path execution failed:\n{error_msg}")
+        self._path_error_box.open()
+    
+    def _apply_status(self, status):
+        """Show a poll published by the status poller"""
+        for key, label, field, fmt in self._poll_plan:
+            result = status.get(key)
+            if result is None:
+                continue  # not read this poll, or connected since
+            self._set_label_text(key, label, fmt(result[field]))
+    
+    def _poll_fast(self):
+        """Poll at the fast rate now that a command was issued.
+        
+        Held for POLL_FAST_HOLD so a move that has not started yet by the
+        next poll does not drop the display back to the idle rate.
+        """
+        self.status_poller.poll_fast(self.POLL_FAST_HOLD)
+    
+    def _set_label_text(self, key, label, text):
+        """setText only when the text differs from what the label shows.
+        
+        The formatted text is already rounded to display precision, so
+        jitter below the last shown digit does not cause a repaint.
+        """
+        if self._last_display.get(key) != text:
+            label.setText(text)
+            self._last_display[key] = text
     
     def log_event(self, message):
         """Add event to log"""
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-    
-    def apply_style(self):
-        """Apply custom styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                min-height: 30px;
-                border-radius: 3px;
-                padding: 5px 10px;
-                background-color: #e0e0e0;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-            }
-        """)
+        sec = int(time.time())
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        self._log_queue.append(f"[{self._ts_cache_str}] {message}")
+    
+    def _flush_log(self):
+        """Append the queued log lines to the event log in one call"""
+        if self._log_queue:
+            batch = "\n".join(self._log_queue)
+            self._log_queue.clear()
+            # One append per flush: a read-only QPlainTextEdit scrolls to the
+            # new text only if it was already at the bottom, so this is also
+            # the only scroll per flush
+            self.log_text.appendPlainText(batch)
+    
+    def _show_banner(self, text, timeout_ms=3000):
+        """Show a notification above the tabs for a few seconds, without
+        blocking the event loop like a message box would"""
+        self.banner.setText(text)
+        self.banner.show()
+        self._banner_timer.start(timeout_ms)
+    
+    @contextmanager
+    def _batched(self, widget):
+        """Hold back repaints of widget while several of its children change,
+        then repaint it once"""
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+    
+    def _set_conn_state(self, label, connected):
+        """Show a device status label as connected/disconnected
+        
+        The colours come from the connState rules in _APP_QSS; flipping the
+        property and re-polishing is cheaper than a per-label setStyleSheet.
+        """
+        label.setText("Connected" if connected else "Disconnected")
+        label.setProperty("connState", "up" if connected else "down")
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.status_poller.set_paused(self.isMinimized())
+    
+    def hideEvent(self, event):
+        # No point reading the devices while nothing shows the results
+        super().hideEvent(event)
+        self.status_poller.set_paused(True)
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.status_poller.set_paused(self.isMinimized())
     
     def closeEvent(self, event):
         """Handle window close"""
-        # Stop path execution if running
-        if self.path_thread and self.path_thread.isRunning():
-            self.path_thread.stop()
-            self.path_thread.wait()
-        
-        # Stop all controllers
-        if self.stepper_controller:
-            self.stepper_controller.stop()
-            self.stepper_controller.close()
-        
-        for controller in self.lts_controllers.values():
-            controller.stop()
-            controller.close()
+        if self._close_started is None:
+            self._close_started = time.monotonic()
+            
+            # Stop path execution if running
+            if self.path_thread and self.path_thread.isRunning():
+                self.path_thread.stop()
+            self.status_poller.stop()
+            
+            # Stop every controller out of band, so the stop is not queued
+            # behind a long command such as a home and also ends a path
+            # step's wait for motion. Each worker is then told to close its
+            # device, which it does after the command it is running.
+            controllers = {device: worker.controller
+                           for device, worker in self.workers.items()
+                           if worker.controller is not None}
+            self._stop_devices(controllers, then={device: self.workers[device].shutdown
+                                                  for device in controllers})
+            for device, worker in self.workers.items():
+                if device not in controllers:
+                    worker.shutdown()  # still connecting, nothing to stop yet
+        
+        # The devices close in parallel on their own workers, so wait for all
+        # of them against one shared deadline. If one is still busy, keep the
+        # window open and try again shortly, so the event loop keeps running
+        # instead of blocking on a stuck device. The window never closes
+        # with a thread still running, as Qt aborts when a running QThread
+        # is destroyed.
+        deadline = time.monotonic() + self.CLOSE_WAIT_MS / 1000
+        threads = [self.path_thread, self.status_poller,
+                   *self.workers.values(), *self._retired_workers]
+        for thread in threads:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if thread is None or thread.wait(remaining_ms):
+                continue
+            if (not self._close_overdue
+                    and time.monotonic() - self._close_started >= self.CLOSE_TIMEOUT):
+                self._close_overdue = True
+                log.warning("%s still running after %.0f s; waiting for it to exit",
+                            type(thread).__name__, self.CLOSE_TIMEOUT)
+            event.ignore()
+            QTimer.singleShot(200, self.close)
+            return
         
         event.accept()
 
 
 def main():
+    # Controller log records are formatted and written on a listener thread,
+    # so logging from the GUI or device threads never blocks on stderr
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener.start()
+    
     app = QApplication(sys.argv)
     
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(_APP_QSS)
     
     gui = UnifiedMotionControlGUI()
     gui.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    listener.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':